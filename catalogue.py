@@ -0,0 +1,228 @@
+import numpy as np
+from transformations import (
+    transform_expert_matrices,
+    calculate_critic_weights,
+    aggregate_expert_evaluations,
+    apply_significance_weights,
+    compute_query_distances,
+)
+from similarity import compute_similarity_matrix, calculate_attitude_values
+
+
+class VendorCatalogue:
+    """
+    Maintains the Scheme B inputs for a changing set of cloud vendors (alternatives).
+
+    Appending or removing vendors only aggregates the changed rows and updates the
+    cached query distances in place. Attitude values and CRITIC weights are kept
+    fixed until a full recompute, and every update reports how far they would shift
+    if recomputed over the current catalogue.
+
+    Stored arrays are resized with np.concatenate/np.delete, so each update still
+    copies O(num_alternatives) values. Only this copy scales with the catalogue size;
+    aggregation, variance and distance computations scale with the changed vendors.
+
+    Attributes:
+        experts (np.ndarray): Expert decision matrices of shape (num_experts, num_alternatives, num_attributes, 2).
+        factor_weights (np.ndarray): Expert factor weights of shape (num_experts, num_attributes).
+        attitude_values (np.ndarray): Attitude values used for the current aggregation.
+        weights_sig (np.ndarray): CRITIC weights used for the current aggregation.
+        tolerance (float): Largest attitude/weight shift tolerated before a full recompute is required.
+        GR_agg (np.ndarray): Weighted aggregated GOFI values of shape (num_alternatives, num_attributes, 2).
+        requires_full_recompute (bool): Whether the last update shifted attitudes or weights beyond tolerance.
+    """
+
+    def __init__(self, experts, factor_weights, attitude_values=None, weights_sig=None, tolerance=1e-2):
+        """
+        Initializes the catalogue and performs the full aggregation once.
+
+        Args:
+            experts (np.ndarray): Expert decision matrices of shape (num_experts, num_alternatives, num_attributes, 2).
+            factor_weights (np.ndarray): Expert factor weights of shape (num_experts, num_attributes).
+            attitude_values (np.ndarray): Precomputed attitude values. Computed from the experts if omitted.
+            weights_sig (np.ndarray): Precomputed CRITIC weights. Computed from the factor weights if omitted.
+            tolerance (float): Largest attitude/weight shift tolerated before a full recompute is required.
+        """
+        self.experts = np.asarray(experts).astype(float)
+        self.factor_weights = factor_weights
+        self.tolerance = tolerance
+
+        # Running sums of the transformed matrices, so variances can be refreshed per changed vendor
+        transformed = transform_expert_matrices(self.experts)
+        self._sum = transformed.sum(axis=1)
+        self._sum_sq = (transformed ** 2).sum(axis=1)
+
+        self.attitude_values = (
+            self._current_attitude_values() if attitude_values is None
+            else np.asarray(attitude_values, dtype=float)
+        )
+        self.weights_sig = (
+            calculate_critic_weights(factor_weights, self.attitude_values) if weights_sig is None
+            else np.asarray(weights_sig, dtype=float)
+        )
+
+        self.GR_agg = self._aggregate(self.experts)
+        self.requires_full_recompute = False
+        self._queries = {}
+        self._query_distances = {}
+
+    @property
+    def num_alternatives(self):
+        return self.experts.shape[1]
+
+    def _aggregate(self, experts):
+        return apply_significance_weights(
+            aggregate_expert_evaluations(experts, self.attitude_values),
+            self.weights_sig,
+        )
+
+    def _current_attitude_values(self):
+        """
+        Computes attitude values over the current catalogue from the running sums.
+
+        Returns:
+            np.ndarray: A 1D array of normalized attitude values for each expert.
+        """
+        count = self.num_alternatives
+        if count < 2:
+            raise ValueError("At least two alternatives are required to compute attitude values.")
+
+        # Same as calculate_variances (ddof=1), without revisiting every alternative
+        variances = (self._sum_sq - self._sum ** 2 / count) / (count - 1)
+        return calculate_attitude_values(compute_similarity_matrix(variances))
+
+    def check_drift(self):
+        """
+        Compares the attitude values and CRITIC weights in use with those of the current catalogue.
+
+        Returns:
+            dict: The largest attitude shift, the largest weight shift and whether a full recompute is required.
+        """
+        attitude_values = self._current_attitude_values()
+        weights_sig = calculate_critic_weights(self.factor_weights, attitude_values)
+
+        attitude_shift = float(np.max(np.abs(attitude_values - self.attitude_values)))
+        weight_shift = float(np.max(np.abs(weights_sig - self.weights_sig)))
+        self.requires_full_recompute = max(attitude_shift, weight_shift) > self.tolerance
+
+        return {
+            "attitude_shift": attitude_shift,
+            "weight_shift": weight_shift,
+            "requires_full_recompute": self.requires_full_recompute,
+        }
+
+    def append_alternatives(self, new_experts):
+        """
+        Appends alternatives, aggregating only the new rows. Stored arrays are reallocated (O(N) copy).
+
+        Args:
+            new_experts (np.ndarray): Evaluations of the new alternatives, of shape (num_experts, num_new, num_attributes, 2).
+
+        Returns:
+            dict: The drift report from check_drift.
+        """
+        new_experts = np.asarray(new_experts).astype(float)
+        if new_experts.shape[0] != self.experts.shape[0] or new_experts.shape[2:] != self.experts.shape[2:]:
+            raise ValueError(
+                f"New evaluations of shape {new_experts.shape} do not match catalogue shape {self.experts.shape}."
+            )
+
+        transformed = transform_expert_matrices(new_experts)
+        self._sum += transformed.sum(axis=1)
+        self._sum_sq += (transformed ** 2).sum(axis=1)
+
+        new_rows = self._aggregate(new_experts)
+        self.experts = np.concatenate([self.experts, new_experts], axis=1)
+        self.GR_agg = np.concatenate([self.GR_agg, new_rows], axis=0)
+
+        for name, query_vector in self._queries.items():
+            self._query_distances[name] = np.concatenate([
+                self._query_distances[name],
+                compute_query_distances(new_rows, query_vector)
+            ])
+
+        return self.check_drift()
+
+    def remove_alternatives(self, indices):
+        """
+        Removes alternatives by index, dropping their rows from every cached structure (O(N) copy).
+
+        Args:
+            indices (list): Indices of the alternatives to remove.
+
+        Returns:
+            dict: The drift report from check_drift.
+        """
+        indices = np.unique(np.asarray(indices, dtype=int))
+        if indices.size and (indices[0] < 0 or indices[-1] >= self.num_alternatives):
+            raise IndexError(f"Alternative indices {indices.tolist()} out of range for {self.num_alternatives} alternatives.")
+        if self.num_alternatives - indices.size < 2:
+            raise ValueError("At least two alternatives must remain in the catalogue.")
+
+        transformed = transform_expert_matrices(self.experts[:, indices])
+        self._sum -= transformed.sum(axis=1)
+        self._sum_sq -= (transformed ** 2).sum(axis=1)
+
+        self.experts = np.delete(self.experts, indices, axis=1)
+        self.GR_agg = np.delete(self.GR_agg, indices, axis=0)
+
+        for name in self._query_distances:
+            self._query_distances[name] = np.delete(self._query_distances[name], indices)
+
+        return self.check_drift()
+
+    def recompute(self):
+        """
+        Recomputes attitude values, CRITIC weights and every cached structure over the full catalogue.
+
+        Returns:
+            None
+        """
+        transformed = transform_expert_matrices(self.experts)
+        self._sum = transformed.sum(axis=1)
+        self._sum_sq = (transformed ** 2).sum(axis=1)
+
+        self.attitude_values = self._current_attitude_values()
+        self.weights_sig = calculate_critic_weights(self.factor_weights, self.attitude_values)
+        self.GR_agg = self._aggregate(self.experts)
+
+        for name, query_vector in self._queries.items():
+            self._query_distances[name] = compute_query_distances(self.GR_agg, query_vector)
+
+        self.requires_full_recompute = False
+
+    def register_query(self, name, query_vector):
+        """
+        Caches the distances of every alternative to a query so later updates stay incremental.
+
+        Args:
+            name (str): Key under which the query is cached.
+            query_vector (list): GOFI query values (μ, v) for each attribute.
+
+        Returns:
+            np.ndarray: A 1D array of distances, one per alternative.
+        """
+        self._queries[name] = query_vector
+        self._query_distances[name] = compute_query_distances(self.GR_agg, query_vector)
+        return self._query_distances[name]
+
+    def rank(self, name, top_k=None):
+        """
+        Ranks alternatives by proximity to a registered query.
+
+        Args:
+            name (str): Key of a registered query.
+            top_k (int): Number of closest alternatives to return. All alternatives if omitted.
+
+        Returns:
+            np.ndarray: Alternative indices ordered from closest to farthest.
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}.")
+
+        distances = self._query_distances[name]
+        if top_k is None or top_k >= distances.size:
+            return np.argsort(distances)
+
+        candidates = np.argpartition(distances, top_k)[:top_k]
+        return candidates[np.argsort(distances[candidates])]
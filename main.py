@@ -7,9 +7,11 @@ from transformations import (
     calculate_variances,
     transform_factor_weights_gr2,
     transform_gr2_to_scalar,
+    calculate_critic_weights,
 )
 from similarity import compute_similarity_matrix, calculate_attitude_values
 from prioritization import scheme_a, scheme_b
+from catalogue import VendorCatalogue
 from visualization import plot_heatmap
 from printer import log_to_file, initialize_output_file
 import numpy as np
@@ -63,14 +65,7 @@ factor_weight_gr2_scalar = transform_gr2_to_scalar(factor_weight_gr2)
 correlation_matrix = pd.DataFrame(factor_weight_gr2_scalar).corr(method="pearson")
 plot_heatmap(correlation_matrix, f"{config.image_dir}/heatmap.png")
 
-factor_weight_gr2_df = pd.DataFrame(factor_weight_gr2_scalar).astype('float')
-deviation = factor_weight_gr2_df.std().to_numpy()
-sum_rows_corr = correlation_matrix.sum(axis=1).to_numpy()
-significance_values = np.abs(deviation * sum_rows_corr)
-
-print(f"Significance Values: {significance_values}")
-
-norm_significance = significance_values / np.sum(significance_values)
+norm_significance = calculate_critic_weights(factor_weights, attitude_values)
 weights_sig = norm_significance.copy()
 
 print(f"Normalized Significance Values: {norm_significance}")
@@ -79,33 +74,10 @@ print(f"Weight Vector 1x{config.num_attributes}: ", list(np.around(norm_signific
 
 scheme_a(norm_significance, experts_transformed, config.num_alternatives, config.num_experts, filex)
 
-GR_agg = np.empty((config.num_alternatives, config.num_attributes), dtype=object)
-
-for alt_idx in range(config.num_alternatives):
-    for attr_idx in range(config.num_attributes):
-        temp_u = np.prod([
-            experts[exp_idx][alt_idx][attr_idx][0] ** attitude_values[exp_idx]
-            for exp_idx in range(config.num_experts)
-        ])
-        temp_v = np.prod([
-            experts[exp_idx][alt_idx][attr_idx][1] ** attitude_values[exp_idx]
-            for exp_idx in range(config.num_experts)
-        ])
-        GR_agg[alt_idx, attr_idx] = [temp_u, temp_v]
-
-GR_agg_transformed = np.array([
-    [
-        [
-            (1 - ((1 - (GR_agg[alt_idx, attr_idx][0] ** 3)) ** weights_sig[attr_idx])) ** (1 / 3),
-            GR_agg[alt_idx, attr_idx][1] ** weights_sig[attr_idx]
-        ]
-        for attr_idx in range(config.num_attributes)
-    ]
-    for alt_idx in range(config.num_alternatives)
-], dtype=object)
+catalogue = VendorCatalogue(experts, factor_weights, attitude_values, weights_sig)
 
 scheme_b(
-    GR_agg_transformed,
+    catalogue.GR_agg,
     config.qrofn,
     weights_sig,
     attitude_values,
@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import random
 from visualization import plot_sensitivity_analysis, plot_prioritization_results
 from config import Config
+from transformations import compute_query_distances
 
 config = Config()
 def rotate(arr, steps=1):
@@ -112,14 +113,7 @@ def scheme_b(GR_agg, qrofn, weights_sig, attitude_values, num_attributes,
     query_vector = [random.choice(qrofn) for _ in range(num_attributes)]
     print(f"Single Query: {query_vector}", file=filex)
 
-    prioritization_order = np.array([
-        np.sqrt(np.sum([
-            (GR_agg[alt_idx][attr_idx][0] - query_vector[attr_idx][0])**2 +
-            (GR_agg[alt_idx][attr_idx][1] - query_vector[attr_idx][1])**2
-            for attr_idx in range(num_attributes)
-        ]))
-        for alt_idx in range(num_alternatives)
-    ])
+    prioritization_order = compute_query_distances(GR_agg, query_vector)
 
     print(f"Prioritization Values: {np.around(prioritization_order, 4).tolist()}", file=filex)
     print(f"Rank: {np.argsort(prioritization_order).tolist()}", file=filex)
@@ -150,14 +144,7 @@ def scheme_b(GR_agg, qrofn, weights_sig, attitude_values, num_attributes,
         print(f"Aggregated Query ({iter_count} Queries): {aggregated_query}", file=filex)
         print(f"Aggregated Query ({iter_count} Queries): {aggregated_query}")
 
-        prioritization_order_multi = np.array([
-            np.sqrt(np.sum([
-                (GR_agg[alt_idx][attr_idx][0] - aggregated_query[attr_idx][0])**2 +
-                (GR_agg[alt_idx][attr_idx][1] - aggregated_query[attr_idx][1])**2
-                for attr_idx in range(num_attributes)
-            ]))
-            for alt_idx in range(num_alternatives)
-        ])
+        prioritization_order_multi = compute_query_distances(GR_agg, aggregated_query)
 
         print(f"Prioritization Values ({iter_count} Queries): {np.around(prioritization_order_multi, 4).tolist()}", file=filex)
         print(f"Prioritization Values ({iter_count} Queries): {np.around(prioritization_order_multi, 4).tolist()}")
@@ -0,0 +1,134 @@
+import random
+
+import numpy as np
+import pytest
+
+from catalogue import VendorCatalogue
+from data_generator import DataGenerator
+from transformations import (
+    transform_expert_matrices,
+    calculate_column_averages,
+    calculate_variances,
+    calculate_critic_weights,
+)
+from similarity import compute_similarity_matrix, calculate_attitude_values
+
+NUM_EXPERTS = 4
+NUM_ALTERNATIVES = 12
+NUM_ATTRIBUTES = 8
+
+
+@pytest.fixture
+def data():
+    random.seed(7)
+    generator = DataGenerator(NUM_EXPERTS, NUM_ALTERNATIVES, NUM_ATTRIBUTES)
+    experts = np.asarray(generator.generate_expert_matrices()).astype(float)
+    factor_weights = generator.generate_factor_weights()
+
+    transformed = transform_expert_matrices(experts)
+    variances = calculate_variances(transformed, calculate_column_averages(transformed))
+    attitude_values = calculate_attitude_values(compute_similarity_matrix(variances))
+    weights_sig = calculate_critic_weights(factor_weights, attitude_values)
+
+    return experts, factor_weights, attitude_values, weights_sig
+
+
+def snapshot(catalogue):
+    return {
+        "experts": catalogue.experts.copy(),
+        "GR_agg": catalogue.GR_agg.copy(),
+        "sum": catalogue._sum.copy(),
+        "sum_sq": catalogue._sum_sq.copy(),
+        "distances": {name: dist.copy() for name, dist in catalogue._query_distances.items()},
+    }
+
+
+def assert_same_state(before, after):
+    np.testing.assert_allclose(after["experts"], before["experts"])
+    np.testing.assert_allclose(after["GR_agg"], before["GR_agg"])
+    np.testing.assert_allclose(after["sum"], before["sum"])
+    np.testing.assert_allclose(after["sum_sq"], before["sum_sq"])
+    assert after["distances"].keys() == before["distances"].keys()
+    for name in before["distances"]:
+        np.testing.assert_allclose(after["distances"][name], before["distances"][name])
+
+
+def test_running_sum_attitudes_match_calculate_variances(data):
+    experts, factor_weights, attitude_values, _ = data
+    catalogue = VendorCatalogue(experts[:, :5], factor_weights)
+    catalogue.append_alternatives(experts[:, 5:])
+
+    np.testing.assert_allclose(catalogue._current_attitude_values(), attitude_values, atol=1e-12)
+
+
+def test_append_matches_fresh_build(data):
+    experts, factor_weights, attitude_values, weights_sig = data
+    query = [(0.8, 0.65)] * NUM_ATTRIBUTES
+
+    catalogue = VendorCatalogue(experts[:, :5], factor_weights, attitude_values, weights_sig)
+    catalogue.register_query("q", query)
+    catalogue.append_alternatives(experts[:, 5:])
+
+    fresh = VendorCatalogue(experts, factor_weights, attitude_values, weights_sig)
+    fresh.register_query("q", query)
+
+    np.testing.assert_allclose(catalogue.GR_agg, fresh.GR_agg)
+    np.testing.assert_allclose(catalogue._query_distances["q"], fresh._query_distances["q"])
+
+
+def test_remove_is_inverse_of_append(data):
+    experts, factor_weights, attitude_values, weights_sig = data
+    catalogue = VendorCatalogue(experts[:, :8], factor_weights, attitude_values, weights_sig)
+    catalogue.register_query("q", [(0.6, 0.7)] * NUM_ATTRIBUTES)
+    before = snapshot(catalogue)
+
+    catalogue.append_alternatives(experts[:, 8:])
+    catalogue.remove_alternatives(range(8, NUM_ALTERNATIVES))
+
+    assert_same_state(before, snapshot(catalogue))
+
+
+def test_drift_flag_set_past_tolerance_and_cleared_by_recompute(data):
+    experts, factor_weights, _, _ = data
+
+    lenient = VendorCatalogue(experts[:, :5], factor_weights, tolerance=1.0)
+    assert not lenient.append_alternatives(experts[:, 5:])["requires_full_recompute"]
+
+    strict = VendorCatalogue(experts[:, :5], factor_weights, tolerance=0.0)
+    report = strict.append_alternatives(experts[:, 5:])
+    assert report["attitude_shift"] > 0
+    assert report["requires_full_recompute"]
+    assert strict.requires_full_recompute
+
+    strict.recompute()
+    assert not strict.requires_full_recompute
+    np.testing.assert_allclose(strict.GR_agg, VendorCatalogue(experts, factor_weights).GR_agg)
+
+
+def test_rank_top_k_is_prefix_of_full_ranking(data):
+    experts, factor_weights, attitude_values, weights_sig = data
+    catalogue = VendorCatalogue(experts, factor_weights, attitude_values, weights_sig)
+    catalogue.register_query("q", [(0.75, 0.6)] * NUM_ATTRIBUTES)
+
+    full = catalogue.rank("q")
+    np.testing.assert_array_equal(full, np.argsort(catalogue._query_distances["q"]))
+    for top_k in (1, 3, NUM_ALTERNATIVES - 1, NUM_ALTERNATIVES, NUM_ALTERNATIVES + 5):
+        np.testing.assert_array_equal(catalogue.rank("q", top_k), full[:top_k])
+
+    with pytest.raises(ValueError):
+        catalogue.rank("q", 0)
+
+
+def test_invalid_remove_leaves_state_unchanged(data):
+    experts, factor_weights, attitude_values, weights_sig = data
+    catalogue = VendorCatalogue(experts, factor_weights, attitude_values, weights_sig)
+    catalogue.register_query("q", [(0.5, 0.5)] * NUM_ATTRIBUTES)
+    before = snapshot(catalogue)
+
+    with pytest.raises(ValueError):
+        catalogue.remove_alternatives(range(NUM_ALTERNATIVES - 1))
+    assert_same_state(before, snapshot(catalogue))
+
+    with pytest.raises(IndexError):
+        catalogue.remove_alternatives([0, NUM_ALTERNATIVES])
+    assert_same_state(before, snapshot(catalogue))
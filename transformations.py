@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 
 def transform_expert_matrices(experts):
     """
@@ -93,3 +94,84 @@ def transform_gr2_to_scalar(gr2_weights):
     mu = gr2_weights[:, :, 0]
     nu = gr2_weights[:, :, 1]
     return mu**3 + nu**3
+
+
+def calculate_critic_weights(factor_weights, attitude_values):
+    """
+    Calculates the attitudinal CRITIC weight vector from expert factor weights.
+
+    Args:
+        factor_weights (np.ndarray): A 2D array of shape (num_experts, num_attributes) containing tuples (μ, v).
+        attitude_values (np.ndarray): A 1D array of normalized attitude values for each expert.
+
+    Returns:
+        np.ndarray: A 1D array of normalized significance values for each attribute.
+    """
+    gr2_scalar = transform_gr2_to_scalar(transform_factor_weights_gr2(factor_weights, attitude_values))
+    gr2_df = pd.DataFrame(gr2_scalar).astype('float')
+
+    deviation = gr2_df.std().to_numpy()
+    sum_rows_corr = gr2_df.corr(method="pearson").sum(axis=1).to_numpy()
+    significance_values = np.abs(deviation * sum_rows_corr)
+
+    return significance_values / np.sum(significance_values)
+
+
+def aggregate_expert_evaluations(experts, attitude_values):
+    """
+    Aggregates expert GOFI evaluations into a single matrix using attitude values:
+    GR_agg = [Π μ_k^att_k, Π v_k^att_k]
+
+    Args:
+        experts (np.ndarray): A 4D array of shape (num_experts, num_alternatives, num_attributes, 2).
+        attitude_values (np.ndarray): A 1D array of normalized attitude values for each expert.
+
+    Returns:
+        np.ndarray: A 3D array of shape (num_alternatives, num_attributes, 2) of aggregated (μ, v).
+    """
+    mu = experts[..., 0].astype(float)
+    nu = experts[..., 1].astype(float)
+    attitude = np.asarray(attitude_values, dtype=float)[:, None, None]
+
+    return np.stack([
+        np.prod(mu ** attitude, axis=0),
+        np.prod(nu ** attitude, axis=0)
+    ], axis=-1)
+
+
+def apply_significance_weights(gr_agg, weights_sig):
+    """
+    Weights aggregated GOFI values factor-wise using the formula:
+    [(1 - (1 - μ^3)^w)^1/3, v^w]
+
+    Args:
+        gr_agg (np.ndarray): A 3D array of shape (num_alternatives, num_attributes, 2) of aggregated (μ, v).
+        weights_sig (np.ndarray): A 1D array of significance weights for each attribute.
+
+    Returns:
+        np.ndarray: A 3D array of the same shape containing weighted (μ, v).
+    """
+    weights = np.asarray(weights_sig, dtype=float)
+
+    return np.stack([
+        (1 - ((1 - gr_agg[..., 0] ** 3) ** weights)) ** (1 / 3),
+        gr_agg[..., 1] ** weights
+    ], axis=-1)
+
+
+def compute_query_distances(GR_agg, query_vector):
+    """
+    Computes the distance of each alternative's aggregated GOFI values to a query vector.
+
+    Args:
+        GR_agg (np.ndarray): Aggregated GR2 values of shape (num_alternatives, num_attributes, 2).
+        query_vector (list): GOFI query values (μ, v) for each attribute.
+
+    Returns:
+        np.ndarray: A 1D array of distances, one per alternative.
+    """
+    GR_agg = np.asarray(GR_agg, dtype=float)
+    query = np.asarray(query_vector, dtype=float)
+    if GR_agg.shape[0] == 0:
+        return np.empty(0)
+    return np.sqrt(np.sum((GR_agg - query) ** 2, axis=(1, 2)))